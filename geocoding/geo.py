@@ -1,6 +1,10 @@
 # CSV 파일에서 주소를 읽어서 경도, 위도로 변환하는 코드 (VWorld API 사용)
 import requests
 import os
+import sys
+import re
+import json
+import numpy as np
 import pandas as pd
 import time
 from dotenv import load_dotenv
@@ -13,17 +17,63 @@ load_dotenv()
 # .env 파일에서 VWorld API 인증키 가져오기
 VWORLD_API_KEY = os.getenv('VWORLD_API_KEY')
 
+# 한국 영역 좌표 범위 (경도, 위도) - 마라도~강원 북단, 백령도~독도
+KOREA_BOUNDS = {
+    'min_lng': 124.5,
+    'max_lng': 132.0,
+    'min_lat': 33.0,
+    'max_lat': 38.7
+}
+
+# 행정구역 경계선 GeoJSON (시도 / 시군구) 및 로컬 캐시 경로
+BOUNDARY_URLS = {
+    'provinces': "https://raw.githubusercontent.com/southkorea/southkorea-maps/master/kostat/2018/json/skorea-provinces-2018-geo.json",
+    'municipalities': "https://raw.githubusercontent.com/southkorea/southkorea-maps/master/kostat/2018/json/skorea-municipalities-2018-geo.json"
+}
+BOUNDARY_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'boundaries')
+
+# 주소에 쓰이는 시도 약칭/변경 명칭 -> 경계선(2018) 정식명칭
+PROVINCE_NAME_MAPPING = {
+    '서울': '서울특별시',
+    '부산': '부산광역시',
+    '대구': '대구광역시',
+    '인천': '인천광역시',
+    '광주': '광주광역시',
+    '대전': '대전광역시',
+    '울산': '울산광역시',
+    '세종': '세종특별자치시',
+    '경기': '경기도',
+    '강원': '강원도',
+    '충북': '충청북도',
+    '충남': '충청남도',
+    '전북': '전라북도',
+    '전남': '전라남도',
+    '경북': '경상북도',
+    '경남': '경상남도',
+    '제주': '제주특별자치도',
+    '강원특별자치도': '강원도',
+    '전북특별자치도': '전라북도'
+}
+
+# 제공자 간 좌표 차이 허용 거리 (km)
+PROVIDER_DISTANCE_THRESHOLD_KM = 5.0
+
 def get_coordinates(address):
     """주소를 받아서 경도, 위도를 반환하는 함수"""
+    longitude, latitude, _ = get_coordinates_with_source(address)
+    return longitude, latitude
+
+def get_coordinates_with_source(address):
+    """주소를 받아서 경도, 위도와 좌표를 제공한 서비스명(vworld/geopy)을 반환하는 함수"""
     if not VWORLD_API_KEY:
         print("❌ 오류: .env 파일에서 VWORLD_API_KEY를 찾을 수 없습니다.")
-        return None, None
+        return None, None, None
     
     # 1단계: VWorld API로 원본 주소 시도
     print(f"🔄 VWorld API로 시도 중...")
     result = try_address_vworld(address)
     if result[0] is not None:
-        return result
+        return result[0], result[1], 'vworld'
     
     # 2단계: VWorld API로 콤마 분리 후 재시도
     if ',' in address:
@@ -34,13 +84,13 @@ def get_coordinates(address):
             print(f"🔄 콤마 분리 후 VWorld API 재처리중...")
             result = try_address_vworld(front_address)
             if result[0] is not None:
-                return result
+                return result[0], result[1], 'vworld'
     
     # 3단계: geopy로 시도
     print(f"⚠️ geopy로 시도 중...")
     result = get_coordinates_geopy(address)
     if result[0] is not None:
-        return result
+        return result[0], result[1], 'geopy'
     
     # 4단계: geopy로 콤마 분리 후 재시도
     if ',' in address:
@@ -49,9 +99,11 @@ def get_coordinates(address):
             front_address = parts[0].strip()
             print(f"❗ 콤마 분리 주소: '{front_address}'")
             print(f"🔄 콤마 분리 후 geopy 재처리중...")
-            return get_coordinates_geopy(front_address)
+            result = get_coordinates_geopy(front_address)
+            if result[0] is not None:
+                return result[0], result[1], 'geopy'
     
-    return None, None
+    return None, None, None
 
 def get_coordinates_geopy(address):
     """geopy를 사용하여 주소를 경도, 위도로 변환하는 함수"""
@@ -88,8 +140,6 @@ def clean_address_for_geopy(address):
         return address
     
     # 한국 주소에 맞게 정제
-    import re
-    
     # 특수문자 제거
     address = re.sub(r'\([^)]*\)', '', address)  # 괄호 안 내용 제거
     address = re.sub(r'[0-9]+층', '', address)   # 층수 제거
@@ -105,8 +155,8 @@ def clean_address_for_geopy(address):
     
     return address
 
-def try_address_vworld(address):
-    """VWorld API 호출을 시도하는 함수"""
+def try_address_vworld(address, address_type="road"):
+    """VWorld API 호출을 시도하는 함수 (address_type: road=도로명, parcel=지번)"""
     apiurl = "https://api.vworld.kr/req/address?"
     params = {
         "service": "address",
@@ -114,7 +164,7 @@ def try_address_vworld(address):
         "crs": "epsg:4326",
         "address": address,
         "format": "json",
-        "type": "road",
+        "type": address_type,
         "key": VWORLD_API_KEY
     }
     
@@ -138,8 +188,269 @@ def try_address_vworld(address):
         print(f"❌ VWorld API 오류 발생: {address} - {str(e)}")
         return None, None
 
-def process_csv(input_file, output_file, address_column):
-    """CSV 파일을 읽어서 주소를 경도, 위도로 변환하고 새로운 CSV로 저장"""
+def load_boundaries():
+    """시도/시군구 경계선 GeoJSON을 로컬 캐시에서 읽고, 없으면 다운로드하여 캐시에 저장하는 함수"""
+    boundaries = {}
+    os.makedirs(BOUNDARY_CACHE_DIR, exist_ok=True)
+    
+    for level, url in BOUNDARY_URLS.items():
+        cache_file = os.path.join(BOUNDARY_CACHE_DIR, os.path.basename(url))
+        
+        # 캐시된 경계선이 있으면 그대로 사용
+        if os.path.exists(cache_file):
+            with open(cache_file, encoding='utf-8') as f:
+                boundaries[level] = json.load(f)
+            continue
+        
+        try:
+            print(f"🔄 경계선 다운로드 중: {url}")
+            response = requests.get(url, timeout=30)
+            if response.status_code == 200:
+                boundaries[level] = response.json()
+                with open(cache_file, 'w', encoding='utf-8') as f:
+                    json.dump(boundaries[level], f, ensure_ascii=False)
+                print(f"✅ 경계선 캐시 저장: {cache_file}")
+            else:
+                print(f"❌ 경계선 다운로드 실패: {response.status_code}")
+                boundaries[level] = None
+        except Exception as e:
+            print(f"❌ 경계선 다운로드 오류: {url} - {str(e)}")
+            boundaries[level] = None
+    
+    return boundaries
+
+def extract_rings(geometry):
+    """GeoJSON Polygon/MultiPolygon 도형에서 (N, 2) 좌표 배열 목록을 추출하는 함수"""
+    if geometry['type'] == 'Polygon':
+        polygons = [geometry['coordinates']]
+    elif geometry['type'] == 'MultiPolygon':
+        polygons = geometry['coordinates']
+    else:
+        return []
+    
+    return [np.asarray(ring, dtype=float)[:, :2] for polygon in polygons for ring in polygon]
+
+def build_region_index(boundaries):
+    """경계선 GeoJSON을 시도명/시군구명 기준의 좌표 배열 색인으로 변환하는 함수"""
+    index = {'provinces': {}, 'municipalities': {}}
+    
+    if boundaries.get('provinces'):
+        for feature in boundaries['provinces']['features']:
+            index['provinces'][feature['properties']['name']] = {
+                'code': str(feature['properties']['code']),
+                'rings': extract_rings(feature['geometry'])
+            }
+    
+    # 시군구는 시도 코드(앞 2자리)별로 묶어서 동명 구(중구, 동구 등)를 구분
+    if boundaries.get('municipalities'):
+        for feature in boundaries['municipalities']['features']:
+            code = str(feature['properties']['code'])
+            name = feature['properties']['name'].replace(' ', '')
+            index['municipalities'].setdefault(code[:2], []).append((name, extract_rings(feature['geometry'])))
+    
+    return index
+
+def parse_address_region(address):
+    """주소 문자열에서 시도 정식명칭과 시군구 이름 후보를 추출하는 함수"""
+    tokens = str(address).split()
+    if not tokens:
+        return None, None, None
+    
+    province = PROVINCE_NAME_MAPPING.get(tokens[0], tokens[0])
+    if province not in PROVINCE_NAME_MAPPING.values():
+        return None, None, None
+    
+    # 시군구 (예: 마포구, 광명시) 및 일반구 (예: 수원시 팔달구)
+    city = tokens[1] if len(tokens) > 1 and re.fullmatch(r'[가-힣]+[시군구]', tokens[1]) else None
+    district = tokens[2] if city and city.endswith('시') and len(tokens) > 2 and re.fullmatch(r'[가-힣]+구', tokens[2]) else None
+    
+    return province, city, district
+
+def find_municipality_rings(region_index, province, city, district):
+    """시도 안에서 주소의 시군구에 해당하는 경계선 좌표 배열을 찾는 함수"""
+    if not city or province not in region_index['provinces']:
+        return None
+    
+    code = region_index['provinces'][province]['code'][:2]
+    candidates = region_index['municipalities'].get(code, [])
+    
+    # 1순위: 일반구까지 일치 (수원시팔달구), 2순위: 시군구 일치, 3순위: 일반구가 나뉜 시 전체 (수원시*)
+    for matcher in (
+        lambda name: district is not None and name == city + district,
+        lambda name: name == city,
+        lambda name: name.startswith(city)
+    ):
+        rings = [ring for name, name_rings in candidates if matcher(name) for ring in name_rings]
+        if rings:
+            return rings
+    
+    return None
+
+def points_in_rings(lngs, lats, rings):
+    """여러 점이 경계선 안에 있는지 한 번에 판정하는 함수 (짝홀 규칙 광선 교차)"""
+    lngs = np.asarray(lngs, dtype=float)
+    lats = np.asarray(lats, dtype=float)
+    inside = np.zeros(len(lngs), dtype=bool)
+    
+    for ring in rings:
+        # 외곽 사각형 밖의 점은 교차 계산에서 제외
+        candidates = (
+            (lngs >= ring[:, 0].min()) & (lngs <= ring[:, 0].max()) &
+            (lats >= ring[:, 1].min()) & (lats <= ring[:, 1].max())
+        )
+        if not candidates.any():
+            continue
+        
+        px = lngs[candidates][:, None]
+        py = lats[candidates][:, None]
+        x1, y1 = ring[:-1, 0], ring[:-1, 1]
+        x2, y2 = ring[1:, 0], ring[1:, 1]
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            crosses = ((y1 > py) != (y2 > py)) & (px < x1 + (py - y1) * (x2 - x1) / (y2 - y1))
+        
+        inside[candidates] ^= (crosses.sum(axis=1) % 2 == 1)
+    
+    return inside
+
+def haversine_km(lng1, lat1, lng2, lat2):
+    """두 좌표 배열 사이의 거리(km)를 계산하는 함수"""
+    lng1, lat1, lng2, lat2 = (np.radians(np.asarray(v, dtype=float)) for v in (lng1, lat1, lng2, lat2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    return 6371.0 * 2 * np.arcsin(np.sqrt(a))
+
+def validate_coordinates(df, address_column, region_index):
+    """전체 결과 프레임의 좌표를 한 번에 검증하여 행별 검증결과(문제 사유, 정상이면 빈 문자열)를 반환하는 함수
+    
+    - 좌표없음: 경도/위도가 비어 있음
+    - 한국범위밖: 한국 영역 좌표 범위를 벗어남
+    - 시도불일치 / 시군구불일치: 주소의 행정구역 경계선 밖에 위치함
+    - 제공자불일치: 대조경도/대조위도 컬럼이 있을 때 두 제공자 좌표가 기준 거리 이상 떨어짐
+    """
+    lngs = pd.to_numeric(df['경도'], errors='coerce').to_numpy(dtype=float)
+    lats = pd.to_numeric(df['위도'], errors='coerce').to_numpy(dtype=float)
+    reasons = [[] for _ in range(len(df))]
+    
+    # 인덱스 라벨이 중복될 수 있으므로 위치 기준으로 기록
+    def flag(mask, reason):
+        for position in np.flatnonzero(mask):
+            reasons[position].append(reason)
+    
+    # 1. 좌표 누락 / 한국 영역 범위 검사
+    missing = np.isnan(lngs) | np.isnan(lats)
+    out_of_bounds = ~missing & ~(
+        (lngs >= KOREA_BOUNDS['min_lng']) & (lngs <= KOREA_BOUNDS['max_lng']) &
+        (lats >= KOREA_BOUNDS['min_lat']) & (lats <= KOREA_BOUNDS['max_lat'])
+    )
+    flag(missing, '좌표없음')
+    flag(out_of_bounds, '한국범위밖')
+    
+    # 2. 주소의 시도/시군구 경계선 포함 검사 (같은 행정구역끼리 묶어서 한 번에 판정)
+    checkable = ~missing & ~out_of_bounds
+    regions = df[address_column].map(parse_address_region)
+    positions = pd.Series(np.arange(len(df)), index=df.index)
+    
+    for province, province_positions in positions[checkable].groupby(regions[checkable].map(lambda r: r[0])):
+        if province not in region_index['provinces']:
+            continue
+        rows = province_positions.to_numpy()
+        inside = points_in_rings(lngs[rows], lats[rows], region_index['provinces'][province]['rings'])
+        mask = np.zeros(len(df), dtype=bool)
+        mask[rows[~inside]] = True
+        flag(mask, '시도불일치')
+    
+    for region, region_positions in positions[checkable].groupby(regions[checkable]):
+        rings = find_municipality_rings(region_index, *region)
+        if rings is None:
+            continue
+        rows = region_positions.to_numpy()
+        inside = points_in_rings(lngs[rows], lats[rows], rings)
+        mask = np.zeros(len(df), dtype=bool)
+        mask[rows[~inside]] = True
+        flag(mask, '시군구불일치')
+    
+    # 3. 제공자 간 좌표 불일치 검사
+    if '대조경도' in df.columns and '대조위도' in df.columns:
+        cross_lngs = pd.to_numeric(df['대조경도'], errors='coerce').to_numpy(dtype=float)
+        cross_lats = pd.to_numeric(df['대조위도'], errors='coerce').to_numpy(dtype=float)
+        with np.errstate(invalid='ignore'):
+            distances = haversine_km(lngs, lats, cross_lngs, cross_lats)
+        flag(~np.isnan(distances) & (distances > PROVIDER_DISTANCE_THRESHOLD_KM), '제공자불일치')
+    
+    return pd.Series([';'.join(row_reasons) for row_reasons in reasons], index=df.index)
+
+def get_cross_check_coordinates(address, source):
+    """제공자 불일치 검사를 위해 좌표를 제공하지 않은 다른 서비스로 좌표를 조회하는 함수"""
+    if source == 'vworld':
+        return get_coordinates_geopy(address)
+    if source == 'geopy':
+        return try_address_vworld(address, address_type="parcel")
+    return None, None
+
+def regeocode_flagged(df, address_column, region_index):
+    """검증에 실패한 행만 다른 조회 방식으로 다시 좌표 변환하는 함수
+    
+    대조경도/대조위도 컬럼이 있으면 후보 좌표의 출처와 다른 제공자로 대조 좌표를 다시 조회하여,
+    제공자 간 좌표도 일치하는 후보만 채택하고 대조 컬럼을 함께 갱신합니다.
+    """
+    cross_check = '대조경도' in df.columns and '대조위도' in df.columns
+    
+    # 제공자불일치만 있는 행은 경계 검사를 이미 통과했으므로, 재조회로 더 나은 근거를 얻을 수 없어 제외
+    flagged = df.index[(df['검증결과'] != '') & (df['검증결과'] != '제공자불일치')]
+    print(f"🔄 재변환 대상: {len(flagged)}/{len(df)}개 행")
+    
+    for index in flagged:
+        address = str(df.at[index, address_column]).strip()
+        if address == '' or address == 'nan':
+            continue
+        
+        print(f"🔄 재변환 중 (행 {index + 1}): {address} - {df.at[index, '검증결과']}")
+        front_address = address.split(',')[0].strip()
+        
+        # 기존 조회 순서와 다른 방식(지번 주소, 콤마 분리 주소)으로 후보 좌표를 조회
+        attempts = [
+            (lambda: try_address_vworld(address, address_type="parcel"), 'vworld'),
+            (lambda: try_address_vworld(front_address, address_type="parcel"), 'vworld'),
+            (lambda: get_coordinates_geopy(front_address), 'geopy')
+        ]
+        cross_coordinates = {}
+        
+        for attempt, source in attempts:
+            longitude, latitude = attempt()
+            if longitude is None:
+                continue
+            
+            # 후보 좌표도 같은 검증을 통과해야 채택
+            candidate = pd.DataFrame({address_column: [address], '경도': [longitude], '위도': [latitude]})
+            if cross_check:
+                # 후보 출처와 다른 제공자의 좌표로 대조 (출처별로 한 번만 조회)
+                if source not in cross_coordinates:
+                    cross_coordinates[source] = get_cross_check_coordinates(address, source)
+                candidate['대조경도'] = [cross_coordinates[source][0]]
+                candidate['대조위도'] = [cross_coordinates[source][1]]
+            
+            if validate_coordinates(candidate, address_column, region_index).iloc[0] == '':
+                print(f"✅ 재변환 성공: ({longitude}, {latitude})")
+                df.at[index, '경도'] = longitude
+                df.at[index, '위도'] = latitude
+                df.at[index, '좌표출처'] = source
+                if cross_check:
+                    df.at[index, '대조경도'] = cross_coordinates[source][0]
+                    df.at[index, '대조위도'] = cross_coordinates[source][1]
+                break
+        else:
+            print(f"❌ 재변환 실패, 기존 좌표 유지: 행 {index + 1}")
+        
+        # API 호출 제한을 위한 대기 (2.0초)
+        time.sleep(2.0)
+    
+    return df
+
+def process_csv(input_file, output_file, address_column, cross_check=False):
+    """CSV 파일을 읽어서 주소를 경도, 위도로 변환하고 검증을 거쳐 새로운 CSV로 저장
+    
+    cross_check=True이면 다른 제공자로도 좌표를 조회하여 제공자 간 불일치를 검사합니다.
+    """
     
     # CSV 파일 읽기
     try:
@@ -166,6 +477,12 @@ def process_csv(input_file, output_file, address_column):
     df.insert(address_index + 1, '경도', None)
     df.insert(address_index + 2, '위도', None)
     
+    # 좌표 출처 및 검증 결과 컬럼은 기존 컬럼 순서를 유지하도록 맨 뒤에 추가
+    df['좌표출처'] = None
+    if cross_check:
+        df['대조경도'] = None
+        df['대조위도'] = None
+    
     print(f"📋 컬럼 순서: {list(df.columns)}")
     
     print(f"🔄 총 {len(df)}개 주소를 처리합니다...")
@@ -179,13 +496,30 @@ def process_csv(input_file, output_file, address_column):
             
         print(f"🔄 처리 중 ({index + 1}/{len(df)}): {address}")
         
-        longitude, latitude = get_coordinates(address)
+        longitude, latitude, source = get_coordinates_with_source(address)
         df.at[index, '경도'] = longitude
         df.at[index, '위도'] = latitude
+        df.at[index, '좌표출처'] = source
+        
+        if cross_check and source is not None:
+            cross_longitude, cross_latitude = get_cross_check_coordinates(address, source)
+            df.at[index, '대조경도'] = cross_longitude
+            df.at[index, '대조위도'] = cross_latitude
         
         # API 호출 제한을 위한 대기 (2.0초)
         time.sleep(2.0)
     
+    # 전체 결과를 한 번에 검증하고, 문제가 있는 행만 재변환
+    print("🔍 좌표 검증 중...")
+    region_index = build_region_index(load_boundaries())
+    if not region_index['provinces']:
+        print("⚠️  경고: 행정구역 경계선을 불러오지 못해 시도/시군구 경계 검사를 건너뜁니다. (좌표 범위/제공자 검사만 수행)")
+    df['검증결과'] = validate_coordinates(df, address_column, region_index)
+    
+    if (df['검증결과'] != '').any():
+        df = regeocode_flagged(df, address_column, region_index)
+        df['검증결과'] = validate_coordinates(df, address_column, region_index)
+    
     # 결과를 새로운 CSV 파일로 저장
     try:
         df.to_csv(output_file, index=False, encoding='utf-8-sig')
@@ -196,6 +530,13 @@ def process_csv(input_file, output_file, address_column):
         total_count = len(df)
         print(f"📊 처리 결과: {success_count}/{total_count}개 성공")
         
+        flagged = df[df['검증결과'] != '']
+        print(f"🔍 검증 결과: {total_count - len(flagged)}/{total_count}개 정상")
+        if not region_index['provinces']:
+            print("⚠️  시도/시군구 경계 검사는 수행되지 않았습니다.")
+        for index, row in flagged.iterrows():
+            print(f"⚠️  행 {index + 1}: {row[address_column]} - {row['검증결과']}")
+        
     except Exception as e:
         print(f"❌ 파일 저장 실패: {str(e)}")
 
@@ -225,8 +566,13 @@ def main():
         print("CSV 파일을 프로젝트 폴더에 넣어주세요.")
         return
     
+    # --cross-check: 다른 제공자로도 좌표를 조회하여 제공자 간 불일치 검사 (API 호출 2배)
+    cross_check = '--cross-check' in sys.argv
+    if cross_check:
+        print("🔍 제공자 간 좌표 대조 검사를 수행합니다.")
+    
     # CSV 처리 시작
-    process_csv(input_file, output_file, address_column)
+    process_csv(input_file, output_file, address_column, cross_check=cross_check)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
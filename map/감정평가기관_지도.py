@@ -6,13 +6,56 @@ import json
 import re
 import requests
 import os
+import sys
+import copy
+import time
 import traceback
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# 프로젝트 경로 및 데이터 파일
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GEO_CSV_PATH = os.path.join(PROJECT_ROOT, 'data', '주택도시보증공사_전세보증금반환보증_선정_정평가기관_GEO.csv')
+BOUNDARY_CACHE_DIR = os.path.join(PROJECT_ROOT, 'data', 'boundaries')
+
+# 지점현황 지역명 정규화 (약칭 -> 정식명칭)
+REGION_NAME_MAPPING = {
+    '경기': '경기도',
+    '강원': '강원도',
+    '충북': '충청북도',
+    '충남': '충청남도',
+    '전북': '전라북도',
+    '전남': '전라남도',
+    '경북': '경상북도',
+    '경남': '경상남도',
+    '제주': '제주특별자치도'
+}
+
+# GeoJSON 지역명 매핑 (약칭 -> 정식명칭)
+GEOJSON_NAME_MAPPING = {
+    '서울': '서울특별시',
+    '부산': '부산광역시',
+    '대구': '대구광역시',
+    '인천': '인천광역시',
+    '광주': '광주광역시',
+    '대전': '대전광역시',
+    '울산': '울산광역시',
+    '세종': '세종특별자치시'
+}
 
 def download_real_korea_boundaries():
     """실제 한국 행정구역 경계선 GeoJSON을 다운로드합니다."""
     
     geojson_url = "https://raw.githubusercontent.com/southkorea/southkorea-maps/master/kostat/2018/json/skorea-provinces-2018-geo.json"
     
+    # 좌표 검증(geocoding/geo.py)에서 캐시한 경계선이 있으면 그대로 사용
+    cache_file = os.path.join(BOUNDARY_CACHE_DIR, os.path.basename(geojson_url))
+    if os.path.exists(cache_file):
+        with open(cache_file, encoding='utf-8') as f:
+            geojson_data = json.load(f)
+        print(f"캐시된 경계선 사용: {len(geojson_data['features'])}개 지역")
+        return geojson_data
+    
     try:
         print(f"다운로드 시도: {geojson_url}")
         response = requests.get(geojson_url, timeout=10)
@@ -27,11 +70,59 @@ def download_real_korea_boundaries():
         print(f"다운로드 오류: {e}")
         return None
 
-def parse_location_data():
+def parse_row_regions(locations, verbose=False):
+    """한 행의 지점현황 문자열을 파싱하여 중복 없는 지역명 목록을 반환합니다."""
+    
+    # 먼저 괄호가 있는 지역들을 처리
+    bracket_pattern = r'([가-힣]+)\([^)]+\)'
+    bracket_matches = re.findall(bracket_pattern, locations)
+    
+    # 괄호가 있는 지역들을 제거한 후 나머지 지역들 처리
+    cleaned_locations = re.sub(r'[가-힣]+\([^)]+\)', '', locations)
+    
+    # 각 행에서 이미 처리된 지역을 추적 (중복 방지)
+    regions = []
+    
+    # 1. 괄호가 있는 지역들 처리 (메인 지역만 카운트)
+    for main_region in bracket_matches:
+        # 메인 지역을 정식 명칭으로 변환
+        main_region = REGION_NAME_MAPPING.get(main_region, main_region)
+        
+        # 메인 지역이 이미 처리되지 않았다면 카운트
+        if main_region not in regions:
+            regions.append(main_region)
+            if verbose:
+                print(f"괄호 지역: {main_region} (1개 추가)")
+    
+    # 2. 괄호가 없는 단일 지역들 처리
+    if cleaned_locations.strip():
+        # 콤마로 분리하고 공백 제거
+        single_locations = [loc.strip() for loc in cleaned_locations.split(',') if loc.strip()]
+        
+        for location in single_locations:
+            # 괄호가 제대로 닫히지 않은 경우 처리
+            if '(' in location and ')' not in location:
+                location = location.split('(')[0].strip()
+            elif ')' in location and '(' not in location:
+                location = location.split(')')[0].strip()
+            
+            if location and location != '' and len(location) > 1:
+                # 지역명 정규화
+                location = REGION_NAME_MAPPING.get(location, location)
+                
+                # 이미 처리되지 않았다면 카운트
+                if location not in regions:
+                    regions.append(location)
+                    if verbose:
+                        print(f"  단일 지역: {location} (1개 추가)")
+    
+    return regions
+
+def parse_location_data(df=None):
     """지점현황 데이터를 파싱하여 지역별 감정평가기관 수를 계산합니다."""
     
-    csv_file_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', '주택도시보증공사_전세보증금반환보증_선정_정평가기관_GEO.csv')
-    df = pd.read_csv(csv_file_path)
+    if df is None:
+        df = pd.read_csv(GEO_CSV_PATH)
     location_counts = {}
     
     print("=== 원본 데이터 확인 ===")
@@ -42,90 +133,11 @@ def parse_location_data():
     
     # 각 행의 지점현황을 파싱
     for index, row in df.iterrows():
-        locations = str(row.iloc[7])
-        
-        # 먼저 괄호가 있는 지역들을 처리
-        bracket_pattern = r'([가-힣]+)\([^)]+\)'
-        bracket_matches = re.findall(bracket_pattern, locations)
-        
-        # 괄호가 있는 지역들을 제거한 후 나머지 지역들 처리
-        cleaned_locations = re.sub(r'[가-힣]+\([^)]+\)', '', locations)
-        
-        # 각 행에서 이미 처리된 지역을 추적 (중복 방지)
-        processed_regions = set()
-        
-        # 1. 괄호가 있는 지역들 처리 (메인 지역만 카운트)
-        for main_region in bracket_matches:
-            # 메인 지역을 정식 명칭으로 변환
-            if main_region == '경기':
-                main_region = '경기도'
-            elif main_region == '강원':
-                main_region = '강원도'
-            elif main_region == '충북':
-                main_region = '충청북도'
-            elif main_region == '충남':
-                main_region = '충청남도'
-            elif main_region == '전북':
-                main_region = '전라북도'
-            elif main_region == '전남':
-                main_region = '전라남도'
-            elif main_region == '경북':
-                main_region = '경상북도'
-            elif main_region == '경남':
-                main_region = '경상남도'
-            elif main_region == '제주':
-                main_region = '제주특별자치도'
-            
-            # 메인 지역이 이미 처리되지 않았다면 카운트
-            if main_region not in processed_regions:
-                if main_region in location_counts:
-                    location_counts[main_region] += 1
-                else:
-                    location_counts[main_region] = 1
-                processed_regions.add(main_region)
-                print(f"괄호 지역: {main_region} (1개 추가)")
-        
-        # 2. 괄호가 없는 단일 지역들 처리
-        if cleaned_locations.strip():
-            # 콤마로 분리하고 공백 제거
-            single_locations = [loc.strip() for loc in cleaned_locations.split(',') if loc.strip()]
-            
-            for location in single_locations:
-                # 괄호가 제대로 닫히지 않은 경우 처리
-                if '(' in location and ')' not in location:
-                    location = location.split('(')[0].strip()
-                elif ')' in location and '(' not in location:
-                    location = location.split(')')[0].strip()
-                
-                if location and location != '' and len(location) > 1:
-                    # 지역명 정규화
-                    if location == '경기':
-                        location = '경기도'
-                    elif location == '강원':
-                        location = '강원도'
-                    elif location == '충북':
-                        location = '충청북도'
-                    elif location == '충남':
-                        location = '충청남도'
-                    elif location == '전북':
-                        location = '전라북도'
-                    elif location == '전남':
-                        location = '전라남도'
-                    elif location == '경북':
-                        location = '경상북도'
-                    elif location == '경남':
-                        location = '경상남도'
-                    elif location == '제주':
-                        location = '제주특별자치도'
-                    
-                    # 이미 처리되지 않았다면 카운트
-                    if location not in processed_regions:
-                        if location in location_counts:
-                            location_counts[location] += 1
-                        else:
-                            location_counts[location] = 1
-                        processed_regions.add(location)
-                        print(f"  단일 지역: {location} (1개 추가)")
+        for region in parse_row_regions(str(row.iloc[7]), verbose=True):
+            if region in location_counts:
+                location_counts[region] += 1
+            else:
+                location_counts[region] = 1
     
     return location_counts
 
@@ -161,6 +173,18 @@ def style_function(feature):
         'opacity': 0.8
     }
 
+def coverage_style_function(feature):
+    """업체별 지점 분포 GeoJSON 스타일 함수 (지점 있음/없음 2단계)"""
+    covered = feature['properties'].get('count', 0) > 0
+    
+    return {
+        'fillColor': '#DC143C' if covered else '#F0F8FF',
+        'color': '#000000',
+        'weight': 2,
+        'fillOpacity': 0.5 if covered else 0.1,
+        'opacity': 0.8
+    }
+
 def highlight_function(feature):
     """호버 시 강조 효과"""
     return {
@@ -171,6 +195,226 @@ def highlight_function(feature):
         'opacity': 1
     }
 
+def apply_location_counts(geojson_data, location_counts, verbose=True):
+    """각 지역의 감정평가기관 수를 GeoJSON에 추가합니다."""
+    
+    for feature in geojson_data['features']:
+        region_name = feature['properties']['name']
+        
+        # 정식명칭으로 직접 매핑 시도
+        if region_name in location_counts:
+            feature['properties']['count'] = location_counts[region_name]
+            if verbose:
+                print(f"✓ {region_name}: {location_counts[region_name]}개 매핑됨")
+        else:
+            # 약칭으로 매핑 시도
+            mapped_count = 0
+            for short_name, full_name in GEOJSON_NAME_MAPPING.items():
+                if full_name == region_name and short_name in location_counts:
+                    mapped_count = location_counts[short_name]
+                    break
+            
+            if mapped_count > 0:
+                feature['properties']['count'] = mapped_count
+                if verbose:
+                    print(f"✓ {region_name} ({short_name}): {mapped_count}개 매핑됨")
+            else:
+                feature['properties']['count'] = 0
+                if verbose:
+                    print(f"✗ {region_name}: 데이터 없음 (0개)")
+    
+    return geojson_data
+
+def build_map(df, geojson_data, location_counts, output_file, bounds=None, coverage=False, verbose=True):
+    """이미 읽어 둔 데이터로 마커와 분포도를 통합한 지도를 생성하고 저장합니다.
+    
+    coverage=True이면 기관 수 분포도 대신 지점 있음/없음 분포도를 기본으로 표시합니다. (업체별 지도)
+    """
+    
+    # 한국 중심 좌표
+    korea_center = [36.5, 127.5]
+    
+    if verbose:
+        print("지도를 생성하는 중...")
+    # 지도 생성 (기본 타일 없이)
+    m = folium.Map(
+        location=korea_center,
+        zoom_start=7,
+        tiles=None,  # 기본 타일 제거
+        attributionControl=False  # 저작권 표시 제거
+    )
+    
+    # 시도별 지도 등은 해당 영역으로 화면 맞춤
+    if bounds is not None:
+        m.fit_bounds(bounds)
+    
+    # Google 타일 레이어 4가지 추가
+    if verbose:
+        print("Google 타일 레이어를 추가하는 중...")
+    
+    # 1. Google 일반지도 (Streets) - 첫 번째 레이어
+    folium.TileLayer(
+        tiles='https://mt1.google.com/vt/lyrs=m&x={x}&y={y}&z={z}',
+        attr='© Google Maps',
+        name='Google 일반지도',
+        overlay=False,
+        control=True
+    ).add_to(m)
+
+    # 2. Google 지형지도 (Terrain) - 두 번째 레이어
+    folium.TileLayer(
+        tiles='https://mt1.google.com/vt/lyrs=p&x={x}&y={y}&z={z}',
+        attr='© Google Terrain',
+        name='Google 지형지도',
+        overlay=False,
+        control=True
+    ).add_to(m)
+    
+    # 3. Google 위성지도 (Satellite) - 세 번째 레이어
+    folium.TileLayer(
+        tiles='https://mt1.google.com/vt/lyrs=s&x={x}&y={y}&z={z}',
+        attr='© Google Satellite',
+        name='Google 위성지도',
+        overlay=False,
+        control=True
+    ).add_to(m)
+    
+    # 4. OpenStreetMap - 마지막 레이어 (기본 타일)
+    folium.TileLayer(
+        tiles='OpenStreetMap',
+        attr='© OpenStreetMap contributors',
+        name='OpenStreetMap',
+        overlay=False,
+        control=True
+    ).add_to(m)
+    
+    if geojson_data is not None:
+        if verbose:
+            print(f"\n=== GeoJSON 데이터 처리 ===")
+            print(f"총 지역 수: {len(geojson_data['features'])}")
+        
+        # 각 지역의 데이터를 GeoJSON에 추가
+        apply_location_counts(geojson_data, location_counts, verbose=verbose)
+        
+        if coverage:
+            for feature in geojson_data['features']:
+                feature['properties']['coverage'] = '지점 있음' if feature['properties']['count'] > 0 else '지점 없음'
+            fields, aliases = ['name', 'coverage'], ['지역', '지점 현황']
+        else:
+            fields, aliases = ['name', 'count'], ['지역', '감정평가기관 수']
+        
+        # GeoJSON 레이어 추가 (분포도)
+        folium.GeoJson(
+            geojson_data,
+            name='지점 분포' if coverage else '지역별 분포도',
+            style_function=coverage_style_function if coverage else style_function,
+            highlight_function=highlight_function,
+            overlay=True ,  # 오버레이 레이어로 설정
+            control=True,  # 레이어 컨트롤에 표시
+            show=coverage,  # 업체별 지도만 기본으로 표시
+            tooltip=folium.GeoJsonTooltip(
+                fields=fields,
+                aliases=aliases,
+                localize=True,
+                sticky=False,
+                labels=True,
+                style="""
+                    background-color: #FFFFFF;
+                    border: 2px solid black;
+                    border-radius: 3px;
+                    box-shadow: 3px;
+                """
+            ),
+            popup=folium.GeoJsonPopup(
+                fields=fields,
+                aliases=aliases,
+                localize=True,
+                labels=True,
+                style="background-color: yellow;",
+            )
+        ).add_to(m)
+
+    # 마커 추가
+    if verbose:
+        print("\n마커를 추가하는 중...")
+    marker_count = 0
+    for idx, row in df.iterrows():
+        try:
+            # 위도, 경도 추출
+            lat = float(row['위도'])
+            lng = float(row['경도'])
+            
+            # 팝업 내용 생성
+            popup_content = f"""
+            <div style="width: 300px;">
+                <h4 style="margin: 0 0 10px 0; color: #2c3e50;">{row['업체명']}</h4>
+                <p style="margin: 5px 0;"><strong>연락처:</strong> {row['연락처']}</p>
+                <p style="margin: 5px 0;"><strong>주소:</strong> {row['주소']}</p>
+                <p style="margin: 5px 0;"><strong>카카오톡:</strong> {row['이메일']}</p>
+                <p style="margin: 5px 0;"><strong>지점현황:</strong> {row['지점현황']}</p>
+            </div>
+            """
+            
+            # 마커 추가
+            folium.Marker(
+                location=[lat, lng],
+                popup=Popup(popup_content, max_width=350),
+                tooltip=row['업체명'],
+                icon=Icon(color='red', icon='info-sign')
+            ).add_to(m)
+            
+            marker_count += 1
+            
+        except (ValueError, TypeError) as e:
+            print(f"행 {idx+1} 처리 중 오류: {e}")
+            continue
+    
+    if verbose:
+        print(f"총 {marker_count}개의 마커를 추가했습니다.\n")
+    
+    # 범례 추가 (업체별 지도: 지점 있음/없음, 그 외: 5단위 세분화 색상 기준)
+    if coverage:
+        legend_html = '''
+    <div style="position: fixed; 
+                bottom: 20px; right: 20px; width: 220px; 
+                background-color: white; border:2px solid #666; z-index:9999; 
+                font-size:12px; padding: 15px; border-radius: 5px; box-shadow: 0 2px 10px rgba(0,0,0,0.1)">
+    <h4 style="margin: 0 0 15px 0; color: #2c3e50; text-align: center;">지점 분포</h4>
+    <p style="margin: 6px 0;"><span style="color:#DC143C; font-size: 16px;">●</span> 지점 있음</p>
+    <p style="margin: 6px 0;"><span style="color:#F0F8FF; font-size: 16px;">●</span> 지점 없음</p>
+    </div>
+    '''
+    else:
+        legend_html = '''
+    <div style="position: fixed; 
+                bottom: 20px; right: 20px; width: 220px; height: 310px; 
+                background-color: white; border:2px solid #666; z-index:9999; 
+                font-size:12px; padding: 15px; border-radius: 5px; box-shadow: 0 2px 10px rgba(0,0,0,0.1)">
+    <h4 style="margin: 0 0 5px 0; color: #2c3e50; text-align: center;">감정평가기관 분포</h4>
+    <p style="margin: 0 0 15px 0; color: #7f8c8d; text-align: center; font-size: 14px;">상단 메뉴를 통해 켜보세요.</p>
+    <p style="margin: 6px 0;"><span style="color:#8B0000; font-size: 16px;">●</span> 35개 이상</p>
+    <p style="margin: 6px 0;"><span style="color:#DC143C; font-size: 16px;">●</span> 30-34개</p>
+    <p style="margin: 6px 0;"><span style="color:#FF4500; font-size: 16px;">●</span> 25-29개</p>
+    <p style="margin: 6px 0;"><span style="color:#FF6347; font-size: 16px;">●</span> 20-24개</p>
+    <p style="margin: 6px 0;"><span style="color:#FF7F50; font-size: 16px;">●</span> 15-19개</p>
+    <p style="margin: 6px 0;"><span style="color:#FFA07A; font-size: 16px;">●</span> 10-14개</p>
+    <p style="margin: 6px 0;"><span style="color:#FFB6C1; font-size: 16px;">●</span> 5-9개</p>
+    <p style="margin: 6px 0;"><span style="color:#F0F8FF; font-size: 16px;">●</span> 5개 미만</p>
+    </div>
+    '''
+    m.get_root().html.add_child(folium.Element(legend_html))
+    
+    # 레이어 컨트롤 추가
+    folium.LayerControl().add_to(m)
+    
+    # 전체화면 버튼 추가
+    plugins.Fullscreen().add_to(m)
+    
+    # 지도 저장
+    m.save(output_file)
+    
+    return m, marker_count
+
 def create_integrated_map():
     """마커와 분포도를 통합한 지도를 생성합니다."""
     
@@ -179,64 +423,12 @@ def create_integrated_map():
         print("CSV 파일을 읽는 중...")
         
         # CSV 파일 읽기
-        csv_file_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', '주택도시보증공사_전세보증금반환보증_선정_정평가기관_GEO.csv')
-        df = pd.read_csv(csv_file_path)
+        df = pd.read_csv(GEO_CSV_PATH)
         print(f"CSV 파일 읽기 완료. 총 {len(df)}개 행을 읽었습니다.")
         
-        # 한국 중심 좌표
-        korea_center = [36.5, 127.5]
-        
-        print("지도를 생성하는 중...")
-        # 지도 생성 (기본 타일 없이)
-        m = folium.Map(
-            location=korea_center,
-            zoom_start=7,
-            tiles=None,  # 기본 타일 제거
-            attributionControl=False  # 저작권 표시 제거
-        )
-        
-        # Google 타일 레이어 4가지 추가
-        print("Google 타일 레이어를 추가하는 중...")
-        
-        # 1. Google 일반지도 (Streets) - 첫 번째 레이어
-        folium.TileLayer(
-            tiles='https://mt1.google.com/vt/lyrs=m&x={x}&y={y}&z={z}',
-            attr='© Google Maps',
-            name='Google 일반지도',
-            overlay=False,
-            control=True
-        ).add_to(m)
-
-        # 2. Google 지형지도 (Terrain) - 두 번째 레이어
-        folium.TileLayer(
-            tiles='https://mt1.google.com/vt/lyrs=p&x={x}&y={y}&z={z}',
-            attr='© Google Terrain',
-            name='Google 지형지도',
-            overlay=False,
-            control=True
-        ).add_to(m)
-        
-        # 3. Google 위성지도 (Satellite) - 세 번째 레이어
-        folium.TileLayer(
-            tiles='https://mt1.google.com/vt/lyrs=s&x={x}&y={y}&z={z}',
-            attr='© Google Satellite',
-            name='Google 위성지도',
-            overlay=False,
-            control=True
-        ).add_to(m)
-        
-        # 4. OpenStreetMap - 마지막 레이어 (기본 타일)
-        folium.TileLayer(
-            tiles='OpenStreetMap',
-            attr='© OpenStreetMap contributors',
-            name='OpenStreetMap',
-            overlay=False,
-            control=True
-        ).add_to(m)
-        
         # 분포도 데이터 처리
         print("지역별 분포도 데이터를 처리하는 중...\n")
-        location_counts = parse_location_data()
+        location_counts = parse_location_data(df)
         
         print("\n=== 최종 지역별 감정평가기관 수 ===")
         for location, count in sorted(location_counts.items()):
@@ -245,142 +437,9 @@ def create_integrated_map():
         # 실제 행정구역 경계선 데이터 가져오기
         geojson_data = download_real_korea_boundaries()
         
-        if geojson_data is not None:
-            print(f"\n=== GeoJSON 데이터 처리 ===")
-            print(f"총 지역 수: {len(geojson_data['features'])}")
-            
-            # 지역명 매핑 (약칭 -> 정식명칭)
-            name_mapping = {
-                '서울': '서울특별시',
-                '부산': '부산광역시', 
-                '대구': '대구광역시',
-                '인천': '인천광역시',
-                '광주': '광주광역시',
-                '대전': '대전광역시',
-                '울산': '울산광역시',
-                '세종': '세종특별자치시'
-            }
-            
-            # 각 지역의 데이터를 GeoJSON에 추가
-            for feature in geojson_data['features']:
-                region_name = feature['properties']['name']
-                
-                # 정식명칭으로 직접 매핑 시도
-                if region_name in location_counts:
-                    feature['properties']['count'] = location_counts[region_name]
-                    print(f"✓ {region_name}: {location_counts[region_name]}개 매핑됨")
-                else:
-                    # 약칭으로 매핑 시도
-                    mapped_count = 0
-                    for short_name, full_name in name_mapping.items():
-                        if full_name == region_name and short_name in location_counts:
-                            mapped_count = location_counts[short_name]
-                            break
-                    
-                    if mapped_count > 0:
-                        feature['properties']['count'] = mapped_count
-                        print(f"✓ {region_name} ({short_name}): {mapped_count}개 매핑됨")
-                    else:
-                        feature['properties']['count'] = 0
-                        print(f"✗ {region_name}: 데이터 없음 (0개)")
-            
-            # GeoJSON 레이어 추가 (분포도)
-            folium.GeoJson(
-                geojson_data,
-                name='지역별 분포도',
-                style_function=style_function,
-                highlight_function=highlight_function,
-                overlay=True ,  # 오버레이 레이어로 설정
-                control=True,  # 레이어 컨트롤에 표시
-                show=False,  # 기본적으로 숨김
-                tooltip=folium.GeoJsonTooltip(
-                    fields=['name', 'count'],
-                    aliases=['지역', '감정평가기관 수'],
-                    localize=True,
-                    sticky=False,
-                    labels=True,
-                    style="""
-                        background-color: #FFFFFF;
-                        border: 2px solid black;
-                        border-radius: 3px;
-                        box-shadow: 3px;
-                    """
-                ),
-                popup=folium.GeoJsonPopup(
-                    fields=['name', 'count'],
-                    aliases=['지역', '감정평가기관 수'],
-                    localize=True,
-                    labels=True,
-                    style="background-color: yellow;",
-                )
-            ).add_to(m)
-        
-        # 마커 추가
-        print("\n마커를 추가하는 중...")
-        marker_count = 0
-        for idx, row in df.iterrows():
-            try:
-                # 위도, 경도 추출
-                lat = float(row['위도'])
-                lng = float(row['경도'])
-                
-                # 팝업 내용 생성
-                popup_content = f"""
-                <div style="width: 300px;">
-                    <h4 style="margin: 0 0 10px 0; color: #2c3e50;">{row['업체명']}</h4>
-                    <p style="margin: 5px 0;"><strong>연락처:</strong> {row['연락처']}</p>
-                    <p style="margin: 5px 0;"><strong>주소:</strong> {row['주소']}</p>
-                    <p style="margin: 5px 0;"><strong>카카오톡:</strong> {row['이메일']}</p>
-                    <p style="margin: 5px 0;"><strong>지점현황:</strong> {row['지점현황']}</p>
-                </div>
-                """
-                
-                # 마커 추가
-                folium.Marker(
-                    location=[lat, lng],
-                    popup=Popup(popup_content, max_width=350),
-                    tooltip=row['업체명'],
-                    icon=Icon(color='red', icon='info-sign')
-                ).add_to(m)
-                
-                marker_count += 1
-                
-            except (ValueError, TypeError) as e:
-                print(f"행 {idx+1} 처리 중 오류: {e}")
-                continue
-        
-        print(f"총 {marker_count}개의 마커를 추가했습니다.\n")
-        
-        # 범례 추가 (5단위 세분화 색상 기준)
-        legend_html = '''
-        <div style="position: fixed; 
-                    bottom: 20px; right: 20px; width: 220px; height: 310px; 
-                    background-color: white; border:2px solid #666; z-index:9999; 
-                    font-size:12px; padding: 15px; border-radius: 5px; box-shadow: 0 2px 10px rgba(0,0,0,0.1)">
-        <h4 style="margin: 0 0 5px 0; color: #2c3e50; text-align: center;">감정평가기관 분포</h4>
-        <p style="margin: 0 0 15px 0; color: #7f8c8d; text-align: center; font-size: 14px;">상단 메뉴를 통해 켜보세요.</p>
-        <p style="margin: 6px 0;"><span style="color:#8B0000; font-size: 16px;">●</span> 35개 이상</p>
-        <p style="margin: 6px 0;"><span style="color:#DC143C; font-size: 16px;">●</span> 30-34개</p>
-        <p style="margin: 6px 0;"><span style="color:#FF4500; font-size: 16px;">●</span> 25-29개</p>
-        <p style="margin: 6px 0;"><span style="color:#FF6347; font-size: 16px;">●</span> 20-24개</p>
-        <p style="margin: 6px 0;"><span style="color:#FF7F50; font-size: 16px;">●</span> 15-19개</p>
-        <p style="margin: 6px 0;"><span style="color:#FFA07A; font-size: 16px;">●</span> 10-14개</p>
-        <p style="margin: 6px 0;"><span style="color:#FFB6C1; font-size: 16px;">●</span> 5-9개</p>
-        <p style="margin: 6px 0;"><span style="color:#F0F8FF; font-size: 16px;">●</span> 5개 미만</p>
-        </div>
-        '''
-        m.get_root().html.add_child(folium.Element(legend_html))
-        
-        # 레이어 컨트롤 추가
-        folium.LayerControl().add_to(m)
-        
-        # 전체화면 버튼 추가
-        plugins.Fullscreen().add_to(m)
-        
         print("지도를 저장하는 중...")
-        # 지도 저장
-        output_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'html', '감정평가기관_지도.html')
-        m.save(output_file)
+        output_file = os.path.join(PROJECT_ROOT, 'html', '감정평가기관_지도.html')
+        m, marker_count = build_map(df, geojson_data, location_counts, output_file)
         
         print(f"통합 지도가 '{output_file}' 파일로 저장되었습니다.")
         print(f"총 {marker_count}개의 감정평가기관이 표시되었습니다.\n")
@@ -392,6 +451,139 @@ def create_integrated_map():
         traceback.print_exc()
         return None, None
 
+# 배치 작업 프로세스마다 한 번만 전달받는 경계선 데이터
+_batch_geojson = None
+
+def _init_batch_worker(geojson_data):
+    """배치 작업 프로세스 초기화 - 미리 읽어 둔 경계선 데이터를 보관합니다."""
+    global _batch_geojson
+    _batch_geojson = geojson_data
+
+def _render_batch_map(job):
+    """배치 작업 하나(지도 1개)를 생성합니다."""
+    
+    # 지역별 count 값을 기록하므로 프로세스에 보관된 원본 대신 복사본 사용
+    geojson_data = None
+    if _batch_geojson is not None:
+        geojson_data = copy.deepcopy(_batch_geojson)
+        if job['regions'] is not None:
+            geojson_data['features'] = [
+                feature for feature in geojson_data['features']
+                if feature['properties']['name'] in job['regions']
+            ]
+    
+    _, marker_count = build_map(
+        job['df'], geojson_data, job['location_counts'], job['output_file'],
+        bounds=job['bounds'], coverage=job['coverage'], verbose=False
+    )
+    return job['output_file'], marker_count
+
+def get_feature_bounds(feature):
+    """GeoJSON 지역의 [[남, 서], [북, 동]] 경계 좌표를 반환합니다."""
+    
+    geometry = feature['geometry']
+    polygons = [geometry['coordinates']] if geometry['type'] == 'Polygon' else geometry['coordinates']
+    lngs = [point[0] for polygon in polygons for ring in polygon for point in ring]
+    lats = [point[1] for polygon in polygons for ring in polygon for point in ring]
+    return [[min(lats), min(lngs)], [max(lats), max(lngs)]]
+
+def count_regions(row_regions):
+    """행별 지역 목록을 합산하여 지역별 감정평가기관 수를 계산합니다."""
+    
+    counts = Counter()
+    for regions in row_regions:
+        counts.update(regions)
+    return dict(counts)
+
+def build_batch_jobs(df, geojson_data):
+    """전국/시도별/업체별 지도에 필요한 데이터 부분집합만 만들어 작업 목록을 반환합니다."""
+    
+    output_dir = os.path.join(PROJECT_ROOT, 'html')
+    
+    # 지점현황은 행마다 한 번만 파싱하고, 지도별 집계는 그 결과를 합산
+    row_regions = pd.Series([parse_row_regions(str(value)) for value in df.iloc[:, 7]], index=df.index)
+    
+    # 1. 전국 지도
+    jobs = [{
+        'name': '전국',
+        'df': df,
+        'location_counts': count_regions(row_regions),
+        'regions': None,
+        'bounds': None,
+        'coverage': False,
+        'output_file': os.path.join(output_dir, '감정평가기관_지도.html')
+    }]
+    
+    # 2. 시도별 지도 - 해당 시도에 지점이 있는 업체만 표시
+    #    (화면은 시도 경계에 맞추며, 마커는 본사 위치이므로 화면 밖에 있을 수 있음)
+    if geojson_data is not None:
+        province_dir = os.path.join(output_dir, '시도별')
+        os.makedirs(province_dir, exist_ok=True)
+        
+        for feature in geojson_data['features']:
+            province = feature['properties']['name']
+            covers = row_regions.map(
+                lambda regions: any(GEOJSON_NAME_MAPPING.get(region, region) == province for region in regions)
+            )
+            jobs.append({
+                'name': province,
+                'df': df[covers],
+                'location_counts': count_regions(row_regions[covers]),
+                'regions': {province},
+                'bounds': get_feature_bounds(feature),
+                'coverage': False,
+                'output_file': os.path.join(province_dir, f'{province}.html')
+            })
+    
+    # 3. 업체별 지도 - 해당 업체의 지점 분포만 표시
+    firm_dir = os.path.join(output_dir, '업체별')
+    os.makedirs(firm_dir, exist_ok=True)
+    
+    for index, row in df.iterrows():
+        firm_name = re.sub(r'[㈜\\/:*?"<>|]', '', str(row['업체명'])).strip()
+        jobs.append({
+            'name': firm_name,
+            'df': df.loc[[index]],
+            'location_counts': count_regions([row_regions[index]]),
+            'regions': None,
+            'bounds': None,
+            'coverage': True,
+            'output_file': os.path.join(firm_dir, f'{firm_name}.html')
+        })
+    
+    return jobs
+
+def create_batch_maps(max_workers=None):
+    """데이터와 경계선을 한 번만 읽어서 전국/시도별/업체별 지도를 병렬로 생성합니다."""
+    
+    start_time = time.perf_counter()
+    
+    print("=== 감정평가기관 배치 지도 생성 시작 ===")
+    df = pd.read_csv(GEO_CSV_PATH)
+    print(f"CSV 파일 읽기 완료. 총 {len(df)}개 행을 읽었습니다.")
+    
+    geojson_data = download_real_korea_boundaries()
+    
+    jobs = build_batch_jobs(df, geojson_data)
+    print(f"생성할 지도: {len(jobs)}개\n")
+    
+    output_files = []
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_batch_worker, initargs=(geojson_data,)) as executor:
+        futures = {executor.submit(_render_batch_map, job): job['name'] for job in jobs}
+        for future in as_completed(futures):
+            try:
+                output_file, marker_count = future.result()
+                output_files.append(output_file)
+                print(f"✓ {futures[future]}: 마커 {marker_count}개 → {output_file}")
+            except Exception as e:
+                print(f"✗ {futures[future]} 지도 생성 중 오류 발생: {e}")
+    
+    elapsed = time.perf_counter() - start_time
+    print(f"\n총 {len(output_files)}/{len(jobs)}개 지도 생성 완료")
+    print(f"전체 소요 시간: {elapsed:.2f}초 ({len(output_files) / elapsed:.2f} 지도/초)")
+    
+    return output_files
+
 def main():
     """메인 함수 - 통합 지도 생성"""
     
@@ -447,4 +639,8 @@ def main():
         traceback.print_exc()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # --batch: 전국/시도별/업체별 지도를 한 번에 생성
+    if '--batch' in sys.argv:
+        create_batch_maps()
+    else:
+        main()
\ No newline at end of file